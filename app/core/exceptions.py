@@ -0,0 +1,5 @@
+"""Application exceptions."""
+
+
+class NotFoundError(Exception):
+    """Raised by services when a requested resource does not exist; served as a 404."""
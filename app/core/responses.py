@@ -0,0 +1,20 @@
+"""Helpers for building HTTP responses."""
+
+from fastapi import Response, status
+
+
+def json_response(content: bytes, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Wrap an already serialized JSON body in a Response.
+
+    Routes return it instead of a model so FastAPI does not re-validate
+    data the services built themselves against a response_model.
+
+    Args:
+        content: The JSON encoded body
+        status_code: The HTTP status of the response
+
+    Returns:
+        Response with the application/json media type
+    """
+    return Response(content=content, status_code=status_code, media_type="application/json")
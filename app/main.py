@@ -1,46 +1,54 @@
 """FastAPI application entry point."""
 
-import asyncio
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
-
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from app.core.event_loop import set_event_loop
+from app.core.exceptions import NotFoundError
 from app.routers import todo, todo_lists, ws
 
+origins = ["http://localhost:5173", "http://127.0.0.1:5173"]
 
-@asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
-    loop = asyncio.get_running_loop()
-    set_event_loop(loop)
 
-    yield
+async def root() -> dict[str, str]:
+    return {"message": "TodoList API is running"}
 
-    # Cleanup
 
-app = FastAPI(
-    title="TodoList API",
-    description="A simple Todo List API",
-    version="1.0.0",
-    lifespan=lifespan
-)
+async def not_found_handler(_request: Request, exc: Exception) -> ORJSONResponse:
+    return ORJSONResponse({"detail": str(exc)}, status_code=status.HTTP_404_NOT_FOUND)
 
-origins = ["http://localhost:5173", "http://127.0.0.1:5173"]
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+def create_app() -> FastAPI:
+    """
+    Build the application, installing middleware and routers exactly once.
 
-app.include_router(todo_lists.router)
-app.include_router(todo.router)
-app.include_router(ws.router)
+    Returns:
+        The configured FastAPI instance
+    """
+    app = FastAPI(
+        title="TodoList API",
+        description="A simple Todo List API",
+        version="1.0.0",
+        default_response_class=ORJSONResponse,
+    )
 
-@app.get("/", tags=["health"])
-async def root() -> dict[str, str]:
-    return {"message": "TodoList API is running"}
+    app.add_exception_handler(NotFoundError, not_found_handler)
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    app.include_router(todo_lists.router)
+    app.include_router(todo.router)
+    app.include_router(ws.router)
+
+    app.add_api_route("/", root, methods=["GET"], tags=["health"])
+
+    return app
+
+
+app = create_app()
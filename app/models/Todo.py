@@ -1,9 +1,8 @@
 """Pydantic models for Todo API."""
 
-from typing import Optional
+from typing import Optional, TypeVar
 
 from pydantic import BaseModel, Field, field_validator, model_validator
-from typing_extensions import Self  # ← necesario para mypy en Python < 3.11
 
 
 class TodoBase(BaseModel):
@@ -13,40 +12,28 @@ class TodoBase(BaseModel):
     description: Optional[str] = None
 
 
-class CreateTodoDTO(TodoBase):
-    """Model for creating a new Todo"""
+_TodoPayload = TypeVar("_TodoPayload", bound=TodoBase)
 
-    @model_validator(mode="after")
-    def at_least_one_field(self) -> Self:
-        if self.description is None and self.completed is None:
-            raise ValueError("At least one field must be provided")
-        return self
 
-    @field_validator("description")
-    def description_not_empty(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        if not v.strip():
-            raise ValueError("description cannot be empty")
-        return v
+def _at_least_one_field(model: _TodoPayload) -> _TodoPayload:
+    if model.description is None and model.completed is None:
+        raise ValueError("At least one field must be provided")
+    return model
+
 
+def _description_not_empty(v: Optional[str]) -> Optional[str]:
+    if v is None:
+        return v
+    if not v.strip():
+        raise ValueError("description cannot be empty")
+    return v
 
-class UpdateTodoDTO(TodoBase):
-    """Model for updating a Todo"""
 
-    @model_validator(mode="after")
-    def at_least_one_field(self) -> Self:
-        if self.description is None and self.completed is None:
-            raise ValueError("At least one field must be provided")
-        return self
+class UpsertTodoDTO(TodoBase):
+    """Model for creating or updating a Todo"""
 
-    @field_validator("description")
-    def description_not_empty(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        if not v.strip():
-            raise ValueError("description cannot be empty")
-        return v
+    at_least_one_field = model_validator(mode="after")(_at_least_one_field)
+    description_not_empty = field_validator("description")(_description_not_empty)
 
 
 class Todo(TodoBase):
@@ -1,7 +1,5 @@
 """Pydantic models for TodoList API."""
 
-from typing import Optional
-
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.Todo import Todo
@@ -11,7 +9,7 @@ class TodoListBase(BaseModel):
     """Base TodoList model with common attributes."""
 
     name: str = Field(..., min_length=1, description="Name of the todo list")
-    todos: Optional[list[Todo]] = []
+    todos: list[Todo] = Field(default_factory=list)
 
 class TodoListCreate(TodoListBase):
     """Model for creating a new TodoList."""
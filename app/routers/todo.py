@@ -1,103 +1,110 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, Response, status
+from pydantic import TypeAdapter
 
-from app.models.Todo import CreateTodoDTO, Todo, UpdateTodoDTO
-from app.services.todo import TodoService, get_todo_service
+from app.core.responses import json_response
+from app.models.Todo import Todo, UpsertTodoDTO
+from app.services.todo_lists import TodoListService, get_todo_list_service
 
 router = APIRouter(prefix="/api/todolists/{todo_list_id}/todos", tags=["todos"])
 
+_TODO_ADAPTER: TypeAdapter[Todo] = TypeAdapter(Todo)
+_TODO_LIST_ADAPTER: TypeAdapter[list[Todo]] = TypeAdapter(list[Todo])
 
-@router.get("", response_model=list[Todo], status_code=status.HTTP_200_OK)
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"model": list[Todo]}},
+)
 async def index(
-    todo_list_id: int, service: Annotated[TodoService, Depends(get_todo_service)]
-) -> list[Todo]:
+    todo_list_id: int, service: Annotated[TodoListService, Depends(get_todo_list_service)]
+) -> Response:
     """
     Get all todos from a specified todo list by ID.
 
     Args:
         todo_list_id: The ID of the todo list that owns these items.
-        service: Injected TodoService instance
+        service: Injected TodoListService instance
 
     Returns:
         HTTP status 200 with a list of todos
 
     Raises:
-        HTTPException: 404 if todo list not found
+        NotFoundError: 404 if todo list not found
     """
-    try:
-        return service.all(todo_list_id)
-    except ValueError as error:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error)) from error
+    return json_response(_TODO_LIST_ADAPTER.dump_json(service.all_todos(todo_list_id)))
 
 
-@router.get("/{todo_id}", response_model=Todo, status_code=status.HTTP_200_OK)
+@router.get(
+    "/{todo_id}",
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"model": Todo}},
+)
 async def show(
-    todo_list_id: int, todo_id: int, service: Annotated[TodoService, Depends(get_todo_service)]
-) -> Todo:
+    todo_list_id: int,
+    todo_id: int,
+    service: Annotated[TodoListService, Depends(get_todo_list_service)],
+) -> Response:
     """
     Get one todo from the specified todo list
 
     Args:
         todo_list_id: The ID of the todo list that owns these items.
         todo_id: The ID of the todo to retrieve
-        service: Injected TodoService instance
+        service: Injected TodoListService instance
 
     Returns:
         HTTP status 200 with a single todo
 
     Raises:
-        HTTPException: 404 if todo list not found
-        HTTPException: 404 if todo not found
+        NotFoundError: 404 if todo list not found
+        NotFoundError: 404 if todo not found
     """
-    try:
-        todo = service.get(todo_list_id, todo_id)
-
-        if todo is None:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Todo list with ID:{todo_list_id} or todo with ID:{todo_id}  not found",
-            )
-
-        return todo
-
-    except ValueError as error:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error)) from error
+    todo = service.get_todo(todo_list_id, todo_id)
+    return json_response(_TODO_ADAPTER.dump_json(todo))
 
 
-@router.post("", response_model=Todo, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": Todo}},
+)
 async def create(
     todo_list_id: int,
-    todo_payload: CreateTodoDTO,
-    service: Annotated[TodoService, Depends(get_todo_service)],
-) -> Todo:
+    todo_payload: UpsertTodoDTO,
+    service: Annotated[TodoListService, Depends(get_todo_list_service)],
+) -> Response:
     """
     Creates one todo for the given todo list
 
     Args:
         todo_list_id: The ID of the todo list which should have the new item.
         todo_payload: The data of the todo to be created
-        service: Injected TodoService instance
+        service: Injected TodoListService instance
 
     Returns:
         HTTP status 201 with the newly created todo
 
     Raises:
-        HTTPException: 404 if todo list not found
+        NotFoundError: 404 if todo list not found
     """
-    try:
-        return service.create(todo_list_id, todo_payload)
-    except ValueError as error:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error)) from error
+    created = service.create_todo(todo_list_id, todo_payload)
+    return json_response(_TODO_ADAPTER.dump_json(created), status.HTTP_201_CREATED)
 
 
-@router.put("/{todo_id}", response_model=Todo, status_code=status.HTTP_200_OK)
+@router.put(
+    "/{todo_id}",
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"model": Todo}},
+)
 async def update(
     todo_list_id: int,
     todo_id: int,
-    todo_payload: UpdateTodoDTO,
-    service: Annotated[TodoService, Depends(get_todo_service)],
-) -> Todo:
+    todo_payload: UpsertTodoDTO,
+    service: Annotated[TodoListService, Depends(get_todo_list_service)],
+) -> Response:
     """
     Updates one todo for the given todo list
 
@@ -105,34 +112,24 @@ async def update(
         todo_list_id: The ID of the todo list which has the todo to be updated.
         todo_id: The ID of the todo to be updated
         todo_payload: The data of the todo to be updated
-        service: Injected TodoService instance
+        service: Injected TodoListService instance
 
     Returns:
         HTTP status 200 with the updated todo
 
     Raises:
-        HTTPException: 404 if todo list not found
-        HTTPException: 404 if todo not found
+        NotFoundError: 404 if todo list not found
+        NotFoundError: 404 if todo not found
     """
-    try:
-        updated = service.update(todo_list_id, todo_id, todo_payload)
-
-        if not updated:
-            raise ValueError(
-                f"Todo list with ID:{todo_list_id} or todo with ID:{todo_id} not found"
-            )
-
-        return updated
-
-    except ValueError as error:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error)) from error
+    updated = service.update_todo(todo_list_id, todo_id, todo_payload)
+    return json_response(_TODO_ADAPTER.dump_json(updated))
 
 
 @router.delete("/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete(
     todo_list_id: int,
     todo_id: int,
-    service: Annotated[TodoService, Depends(get_todo_service)],
+    service: Annotated[TodoListService, Depends(get_todo_list_service)],
 ) -> Response:
     """
     Deletes one todo for the given todo list
@@ -140,22 +137,14 @@ async def delete(
     Args:
         todo_list_id: The ID of the todo list which has the todo to be deleted.
         todo_id: The ID of the todo to be deleted
-        service: Injected TodoService instance
+        service: Injected TodoListService instance
 
     Returns:
         HTTP status 204 with no response data
 
     Raises:
-        HTTPException: 404 if todo list not found
-        HTTPException: 404 if todo not found
+        NotFoundError: 404 if todo list not found
+        NotFoundError: 404 if todo not found
     """
-    try:
-        deleted = service.delete(todo_list_id, todo_id)
-
-        if not deleted:
-            raise ValueError("todo not found")
-
-        return Response(status_code=status.HTTP_204_NO_CONTENT)
-
-    except ValueError as error:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(error)) from error
+    service.delete_todo(todo_list_id, todo_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -2,8 +2,10 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
+from pydantic import TypeAdapter
 
+from app.core.responses import json_response
 from app.models.TodoList import (
     TodoList,
     TodoListCreate,
@@ -15,25 +17,36 @@ from app.services.todo_lists import TodoListService, get_todo_list_service
 
 router = APIRouter(prefix="/api/todolists", tags=["todolists"])
 
+_TODO_LIST_ADAPTER: TypeAdapter[TodoList] = TypeAdapter(TodoList)
+_TODO_LISTS_ADAPTER: TypeAdapter[list[TodoList]] = TypeAdapter(list[TodoList])
 
-@router.get("", response_model=list[TodoList], status_code=status.HTTP_200_OK)
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"model": list[TodoList]}},
+)
 async def index(
     service: Annotated[TodoListService, Depends(get_todo_list_service)],
-) -> list[TodoList]:
+) -> Response:
     """
     Get all todo lists.
 
     Returns:
         List of all TodoList objects
     """
-    return service.all()
+    return json_response(_TODO_LISTS_ADAPTER.dump_json(service.all()))
 
 
-@router.get("/{todo_list_id}", response_model=TodoList, status_code=status.HTTP_200_OK)
+@router.get(
+    "/{todo_list_id}",
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"model": TodoList}},
+)
 async def show(
     todo_list_id: int,
     service: Annotated[TodoListService, Depends(get_todo_list_service)],
-) -> TodoList:
+) -> Response:
     """
     Get a specific todo list by ID.
 
@@ -45,22 +58,21 @@ async def show(
         TodoList object
 
     Raises:
-        HTTPException: 404 if todo list not found
+        NotFoundError: 404 if todo list not found
     """
     todo_list = service.get(todo_list_id)
-    if todo_list is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"TodoList with id {todo_list_id} not found",
-        )
-    return todo_list
+    return json_response(_TODO_LIST_ADAPTER.dump_json(todo_list))
 
 
-@router.post("", response_model=TodoList, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": TodoList}},
+)
 async def create(
     todo_list_data: TodoListCreate,
     service: Annotated[TodoListService, Depends(get_todo_list_service)],
-) -> TodoList:
+) -> Response:
     """
     Create a new todo list.
 
@@ -71,15 +83,20 @@ async def create(
     Returns:
         The newly created TodoList object
     """
-    return service.create(todo_list_data)
+    created = service.create(todo_list_data)
+    return json_response(_TODO_LIST_ADAPTER.dump_json(created), status.HTTP_201_CREATED)
 
 
-@router.put("/{todo_list_id}", response_model=TodoList, status_code=status.HTTP_200_OK)
+@router.put(
+    "/{todo_list_id}",
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_200_OK: {"model": TodoList}},
+)
 async def update(
     todo_list_id: int,
     todo_list_data: TodoListUpdate,
     service: Annotated[TodoListService, Depends(get_todo_list_service)],
-) -> TodoList:
+) -> Response:
     """
     Update an existing todo list.
 
@@ -92,15 +109,10 @@ async def update(
         Updated TodoList object
 
     Raises:
-        HTTPException: 404 if todo list not found
+        NotFoundError: 404 if todo list not found
     """
     updated_todo_list = service.update(todo_list_id, todo_list_data)
-    if updated_todo_list is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"TodoList with id {todo_list_id} not found",
-        )
-    return updated_todo_list
+    return json_response(_TODO_LIST_ADAPTER.dump_json(updated_todo_list))
 
 
 @router.delete("/{todo_list_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -116,14 +128,9 @@ async def delete(
         service: Injected TodoListService instance
 
     Raises:
-        HTTPException: 404 if todo list not found
+        NotFoundError: 404 if todo list not found
     """
-    deleted = service.delete(todo_list_id)
-    if not deleted:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"TodoList with id {todo_list_id} not found",
-        )
+    service.delete(todo_list_id)
 
 @router.put(
     "/{todo_list_id}/toggle-complete-async",
@@ -150,22 +157,20 @@ async def toggle_complete_async(
         HTTP 202 Status accepted with todo_list_id
 
     Raises:
-        HTTPException: 404 if todo list not found
+        NotFoundError: 404 if todo list not found
+        HTTPException: 409 if a toggle is already running for the list
     """
-    todo_list = service.get(todo_list_id)
-    if todo_list is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"TodoList with id {todo_list_id} not found",
-        )
+    # Raises NotFoundError (404) before any background work is scheduled
+    service.get(todo_list_id)
 
-    if service.is_locked(todo_list_id):
+    # The background job holds the lock while it runs; this only rejects early
+    lock = service.with_lock(todo_list_id)
+    if lock.locked():
         raise HTTPException(
             status_code=409,
             detail="Toggle in progress. Try again later."
         )
 
-    service.lock(todo_list_id)
     background_tasks.add_task(
         service.process_toggle_complete_background,
         todo_list_id,
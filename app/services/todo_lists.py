@@ -1,32 +1,44 @@
 """TodoList service with in-memory storage."""
 
 import asyncio
-from typing import Optional
 
-from app.core.event_loop import get_loop
-from app.models.Todo import Todo
+from app.core.exceptions import NotFoundError
+from app.models.Todo import Todo, UpsertTodoDTO
 from app.models.TodoList import TodoList, TodoListCreate, TodoListUpdate
 from app.websocket.manager import websocket_manager
 
 
 class TodoListService:
     """Service for managing TodoLists with in-memory storage."""
-    _locks: set[int] = set()
 
-    def is_locked(self, list_id: int) -> bool:
-        return list_id in self._locks
-
-    def lock(self, list_id: int) -> None:
-        self._locks.add(list_id)
-
-    def unlock(self, list_id: int) -> None:
-        self._locks.discard(list_id)
+    __slots__ = ("_by_id", "_todos_by_id", "_next_todo_ids", "_locks", "_next_id")
 
     def __init__(self) -> None:
         """Initialize the service with empty storage."""
-        self._storage: list[TodoList] = []
+        self._by_id: dict[int, TodoList] = {}
+        self._todos_by_id: dict[int, dict[int, Todo]] = {}
+        self._next_todo_ids: dict[int, int] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
         self._next_id: int = 1
 
+    def with_lock(self, list_id: int) -> asyncio.Lock:
+        """
+        Get the lock guarding bulk operations on a todo list.
+
+        Use it as ``async with service.with_lock(list_id): ...``; ``locked()``
+        tells whether such a block is currently running.
+
+        Args:
+            list_id: The ID of the todo list
+
+        Returns:
+            The asyncio.Lock of the todo list, created on first use
+        """
+        lock = self._locks.get(list_id)
+        if lock is None:
+            lock = self._locks[list_id] = asyncio.Lock()
+        return lock
+
     def all(self) -> list[TodoList]:
         """
         Get all todo lists.
@@ -34,9 +46,9 @@ class TodoListService:
         Returns:
             List of all TodoList objects
         """
-        return self._storage.copy()
+        return list(self._by_id.values())
 
-    def get(self, todo_list_id: int) -> Optional[TodoList]:
+    def get(self, todo_list_id: int) -> TodoList:
         """
         Get a specific todo list by ID.
 
@@ -44,12 +56,16 @@ class TodoListService:
             todo_list_id: The ID of the todo list to retrieve
 
         Returns:
-            TodoList object if found, None otherwise
+            The TodoList object
+
+        Raises:
+            NotFoundError: If the todo list does not exist
         """
-        for todo_list in self._storage:
-            if todo_list.id == todo_list_id:
-                return todo_list
-        return None
+        todo_list = self._by_id.get(todo_list_id)
+        if todo_list is None:
+            raise NotFoundError(f"Todo list with ID:{todo_list_id} not found")
+
+        return todo_list
 
     def create(self, todo_list_data: TodoListCreate) -> TodoList:
         """
@@ -62,11 +78,13 @@ class TodoListService:
             The newly created TodoList object
         """
         new_todo_list = TodoList(id=self._next_id, name=todo_list_data.name)
-        self._storage.append(new_todo_list)
+        self._by_id[new_todo_list.id] = new_todo_list
+        self._todos_by_id[new_todo_list.id] = {}
+        self._next_todo_ids[new_todo_list.id] = 1
         self._next_id += 1
         return new_todo_list
 
-    def update(self, todo_list_id: int, todo_list_data: TodoListUpdate) -> Optional[TodoList]:
+    def update(self, todo_list_id: int, todo_list_data: TodoListUpdate) -> TodoList:
         """
         Update an existing todo list.
 
@@ -75,14 +93,17 @@ class TodoListService:
             todo_list_data: New data for the todo list
 
         Returns:
-            Updated TodoList object if found, None otherwise
+            The updated TodoList object
+
+        Raises:
+            NotFoundError: If the todo list does not exist
         """
-        for i, todo_list in enumerate(self._storage):
-            if todo_list.id == todo_list_id:
-                updated_todo_list = TodoList(id=todo_list_id, name=todo_list_data.name)
-                self._storage[i] = updated_todo_list
-                return updated_todo_list
-        return None
+        self.get(todo_list_id)
+
+        updated_todo_list = TodoList(id=todo_list_id, name=todo_list_data.name)
+        self._by_id[todo_list_id] = updated_todo_list
+        self._todos_by_id[todo_list_id] = {}
+        return updated_todo_list
 
     def delete(self, todo_list_id: int) -> bool:
         """
@@ -92,104 +113,185 @@ class TodoListService:
             todo_list_id: The ID of the todo list to delete
 
         Returns:
-            True if deleted, False if not found
+            True if deleted
+
+        Raises:
+            NotFoundError: If the todo list does not exist
         """
-        for i, todo_list in enumerate(self._storage):
-            if todo_list.id == todo_list_id:
-                self._storage.pop(i)
-                return True
-        return False
+        if self._by_id.pop(todo_list_id, None) is None:
+            raise NotFoundError(f"Todo list with ID:{todo_list_id} not found")
 
-    def get_todos(self, todo_list_id: int) -> Optional[list[Todo]]:
-        for todo_list in self._storage:
-            if todo_list.id == todo_list_id:
-                return todo_list.todos
-        return None
+        del self._todos_by_id[todo_list_id]
+        del self._next_todo_ids[todo_list_id]
+        self._locks.pop(todo_list_id, None)
+        return True
 
-    def process_toggle_complete_background(self, todo_list_id: int, completed: bool) -> None:
+    def all_todos(self, todo_list_id: int) -> list[Todo]:
         """
-        Background long-running toggle-complete.
-        Notifies frontend through WebSocket.
+        Gets all items from a given TodoList.
+
+        Args:
+            todo_list_id: The ID of the todo list
+
+        Returns:
+            The todo list items
+
+        Raises:
+            NotFoundError: If the todo list does not exist
+        """
+        return self.get(todo_list_id).todos
+
+    def get_todo(self, todo_list_id: int, todo_id: int) -> Todo:
+        """
+        Gets one Todo from the given TodoList.
+
+        Args:
+            todo_list_id: The ID of the todo list
+            todo_id: The ID of the todo
+
+        Returns:
+            Todo specified item of the specified todo list
+
+        Raises:
+            NotFoundError: If the todo list or the todo does not exist
         """
-        event_loop = get_loop()
-        try:
-            todo_list = self.get(todo_list_id)
-
-            if not todo_list:
-                event_loop.call_soon_threadsafe(
-                    lambda: (
-                        asyncio.create_task(
-                            websocket_manager.broadcast_retry(
-                                todo_list_id,
-                                {
-                                    "event": "toggle_complete_error",
-                                    "listId": todo_list_id,
-                                    "error": "TodoList not found"
-                                }
-                            )
-                        )
-                    )
-                )
-                return
-
-            todos = todo_list.todos or []
-
-            for todo in todos:
-                todo.completed = completed
-
-            event_loop.call_soon_threadsafe(
-                lambda: (
-                    asyncio.create_task(
-                        websocket_manager.broadcast_retry(
-                            todo_list_id,
-                            {
-                                "event": "toggle_complete_done",
-                                "listId": todo_list_id,
-                                "completed": completed
-                            }
-                        )
-                    )
-                )
+        todos_by_id = self._todos_by_id.get(todo_list_id)
+        if todos_by_id is None:
+            raise NotFoundError(f"Todo list with ID:{todo_list_id} not found")
+
+        todo = todos_by_id.get(todo_id)
+        if todo is None:
+            raise NotFoundError(
+                f"Todo with ID:{todo_id} from todo list with ID:{todo_list_id} not found"
             )
 
+        return todo
 
-        except Exception as err:
-            captured_err = str(err)
+    def create_todo(self, todo_list_id: int, todo_payload: UpsertTodoDTO) -> Todo:
+        """
+        Adds a todo to an existing TodoList.
+
+        Todo IDs grow monotonically per list and are never reused, even after
+        the todo holding one is deleted or an update empties the list.
+
+        Args:
+            todo_list_id: The ID of the todo list
+            todo_payload: The item data
 
-            def _retry_task(err_msg: str = captured_err) -> None:
-                asyncio.create_task(
-                    websocket_manager.broadcast_retry(
-                        todo_list_id,
-                        {
-                            "event": "toggle_complete_error",
-                            "listId": todo_list_id,
-                            "error": err_msg,
-                        },
-                    )
-                )
+        Returns:
+            The newly created todo
 
-            event_loop.call_soon_threadsafe(_retry_task)
+        Raises:
+            NotFoundError: If the todo list does not exist
+        """
+        todo_list = self.get(todo_list_id)
+        new_id = self._next_todo_ids[todo_list_id]
+        self._next_todo_ids[todo_list_id] = new_id + 1
+
+        new_todo = Todo.model_construct(
+            id=new_id,
+            completed=todo_payload.completed,
+            description=todo_payload.description,
+        )
+        todo_list.todos.append(new_todo)
+        self._todos_by_id[todo_list_id][new_id] = new_todo
+        return new_todo
+
+    def update_todo(self, todo_list_id: int, todo_id: int, todo_payload: UpsertTodoDTO) -> Todo:
+        """
+        Updates the given Todo of the given TodoList
 
-        finally:
-            del todos
-            del todo_list
+        Args:
+            todo_list_id: The ID of the todo list
+            todo_id: The ID of the todo
+            todo_payload: The item data
+
+        Returns:
+            The updated todo
+
+        Raises:
+            NotFoundError: If the todo list or the todo does not exist
+        """
+        todo = self.get_todo(todo_list_id, todo_id)
+
+        # Updated in place: the same instance is referenced by the list and the index
+        todo.completed = todo_payload.completed
+        todo.description = todo_payload.description
+        return todo
+
+    def delete_todo(self, todo_list_id: int, todo_id: int) -> bool:
+        """
+        Deletes the given Todo of the given TodoList
+
+        Args:
+            todo_list_id: The ID of the todo list
+            todo_id: The ID of the todo
+
+        Returns:
+            True if deleted
+
+        Raises:
+            NotFoundError: If the todo list or the todo does not exist
+        """
+        todo_list = self.get(todo_list_id)
+        todo = self._todos_by_id[todo_list_id].pop(todo_id, None)
+        if todo is None:
+            raise NotFoundError(
+                f"Todo with ID:{todo_id} from todo list with ID:{todo_list_id} not found"
+            )
+
+        todos = todo_list.todos
+        todos.pop(next(idx for idx, item in enumerate(todos) if item is todo))
+        return True
+
+    async def process_toggle_complete_background(self, todo_list_id: int, completed: bool) -> None:
+        """
+        Background long-running toggle-complete.
+        Notifies frontend through WebSocket.
+
+        Holds with_lock(todo_list_id) while the items are toggled, so it is
+        released even if the task fails.
+        """
+        message: dict[str, object]
+        async with self.with_lock(todo_list_id):
+            try:
+                for todo in self.get(todo_list_id).todos:
+                    todo.completed = completed
+
+                message = {
+                    "event": "toggle_complete_done",
+                    "listId": todo_list_id,
+                    "completed": completed,
+                }
+
+            except NotFoundError:
+                message = {
+                    "event": "toggle_complete_error",
+                    "listId": todo_list_id,
+                    "error": "TodoList not found",
+                }
+
+            except Exception as err:
+                message = {
+                    "event": "toggle_complete_error",
+                    "listId": todo_list_id,
+                    "error": str(err),
+                }
+
+        await websocket_manager.broadcast_retry(todo_list_id, message)
 
-            self.unlock(todo_list_id)
 
 # Global singleton instance
-_todo_list_service: Optional[TodoListService] = None
+_todo_list_service: TodoListService = TodoListService()
 
 
 def get_todo_list_service() -> TodoListService:
     """
-    Get or create the singleton TodoListService instance.
+    Get the singleton TodoListService instance.
 
     This function is used for dependency injection in FastAPI.
 
     Returns:
         The singleton TodoListService instance
     """
-    global _todo_list_service
-    if _todo_list_service is None:
-        _todo_list_service = TodoListService()
     return _todo_list_service
@@ -1,9 +1,12 @@
 import asyncio
 
+import orjson
 from fastapi import WebSocket
 
 
 class WebSocketManager:
+    __slots__ = ("active_connections",)
+
     def __init__(self) -> None:
         self.active_connections: dict[int, set[WebSocket]] = {}
 
@@ -21,13 +24,20 @@ class WebSocketManager:
                 del self.active_connections[list_id]
 
     async def broadcast(self, list_id: int, message: dict[str, object]) -> None:
+        await self._broadcast_text(list_id, orjson.dumps(message).decode())
+
+    async def _broadcast_text(self, list_id: int, payload: str) -> None:
+        """Sends an already serialized message to every connection of the list."""
         if list_id not in self.active_connections:
             return
 
-        for ws in list(self.active_connections[list_id]):
-            try:
-                await ws.send_json(message)
-            except Exception:
+        connections = list(self.active_connections[list_id])
+        results = await asyncio.gather(
+            *(ws.send_text(payload) for ws in connections), return_exceptions=True
+        )
+
+        for ws, result in zip(connections, results):
+            if isinstance(result, Exception):
                 self.disconnect(list_id, ws)
 
     async def broadcast_retry(
@@ -41,13 +51,12 @@ class WebSocketManager:
         Retries broadcast until at least one client is connected.
         Useful when server reloads and WS connects slightly after the background task.
         """
-        for attempt in range(retries):
-            conns = self.active_connections.get(list_id)
-
-            print(f"[WS RETRY] attempt={attempt} connections={0 if conns is None else len(conns)}")
+        payload = orjson.dumps(message).decode()
 
+        for _ in range(retries):
+            conns = self.active_connections.get(list_id)
             if conns and len(conns) > 0:
-                return await self.broadcast(list_id, message)
+                return await self._broadcast_text(list_id, payload)
 
             await asyncio.sleep(delay)
 
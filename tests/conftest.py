@@ -0,0 +1,82 @@
+"""Shared pytest fixtures."""
+
+from collections.abc import Callable, Generator
+from contextvars import ContextVar, Token
+from typing import Any, TypeVar
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.services.todo_lists import get_todo_list_service
+
+_T = TypeVar("_T")
+
+# Service double of the running test; each xdist worker is its own process with its own app
+_current_service: ContextVar[Any] = ContextVar("_current_service")
+
+
+def _override_get_service() -> Any:
+    return _current_service.get()
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """
+    Build the application once for the session.
+
+    The TodoListService dependency is routed to the double of the running test.
+
+    Returns:
+        The FastAPI instance under test
+    """
+    application = create_app()
+    application.dependency_overrides[get_todo_list_service] = _override_get_service
+    return application
+
+
+@pytest.fixture(scope="session")
+def client(app: FastAPI) -> TestClient:
+    """
+    Create a test client for the FastAPI app, shared by the session.
+
+    Returns:
+        TestClient instance
+    """
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def async_client(app: FastAPI) -> httpx.AsyncClient:
+    """
+    Create an async client driving the FastAPI app in-process, shared by the session.
+
+    Returns:
+        AsyncClient bound to the app through an ASGITransport
+    """
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.fixture
+def use_service() -> Generator[Callable[[_T], _T], None, None]:
+    """
+    Provide a function installing a service double for the current test.
+
+    The double is removed on teardown, so a later test that installs none
+    fails with LookupError instead of reusing a stale one. Call it from
+    fixtures, not from async test bodies, which run in a copied context.
+
+    Yields:
+        Function that makes its argument the injected TodoListService and returns it
+    """
+    tokens: list[Token[Any]] = []
+
+    def install(service: _T) -> _T:
+        tokens.append(_current_service.set(service))
+        return service
+
+    yield install
+    for token in reversed(tokens):
+        _current_service.reset(token)
@@ -1,232 +1,277 @@
 """Unit tests for TodoList API endpoints."""
 
-from collections.abc import Generator
-from unittest.mock import MagicMock
+from collections.abc import Callable
+from typing import Optional
 
+import httpx
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-
-from app.main import app
-from app.models.Todo import Todo
-from app.services.todo import get_todo_service
+from pydantic import ValidationError
+
+from app.core.exceptions import NotFoundError
+from app.models.Todo import Todo, UpsertTodoDTO
+
+# Request bodies are encoded once instead of on every call
+_CREATE_BODY = orjson.dumps({"description": "Awesome task 1", "completed": False})
+_UPDATE_BODY = orjson.dumps({"description": "Updated todo", "completed": "False"})
+_UPDATE_404_BODY = orjson.dumps({"description": "Updated", "completed": "False"})
+_EMPTY_BODY = orjson.dumps({})
+_HEADERS = {"content-type": "application/json"}
+
+# Requests are built once; httpx re-reads their byte bodies on every send
+_URL_TODOS = "http://test/api/todolists/1/todos"
+_URL_TODO_1 = f"{_URL_TODOS}/1"
+_URL_TODO_999 = f"{_URL_TODOS}/999"
+_REQ_INDEX = httpx.Request("GET", _URL_TODOS)
+_REQ_SHOW = httpx.Request("GET", _URL_TODO_1)
+_REQ_SHOW_404 = httpx.Request("GET", _URL_TODO_999)
+_REQ_CREATE = httpx.Request("POST", _URL_TODOS, content=_CREATE_BODY, headers=_HEADERS)
+_REQ_CREATE_EMPTY = httpx.Request("POST", _URL_TODOS, content=_EMPTY_BODY, headers=_HEADERS)
+_REQ_UPDATE = httpx.Request("PUT", _URL_TODO_1, content=_UPDATE_BODY, headers=_HEADERS)
+_REQ_UPDATE_404 = httpx.Request("PUT", _URL_TODO_999, content=_UPDATE_404_BODY, headers=_HEADERS)
+_REQ_DELETE = httpx.Request("DELETE", _URL_TODO_1)
+_REQ_DELETE_404 = httpx.Request("DELETE", _URL_TODO_999)
+
+# Service return values, constructed once without running validation
+_TODO_1 = Todo.model_construct(id=1, description="Awesome task 1", completed=False)
+_TODO_2 = Todo.model_construct(id=2, description="Awesome task 2", completed=False)
+_UPDATED_TODO = Todo.model_construct(id=1, description="Updated todo", completed=True)
+_TODO_NOT_FOUND_MESSAGE = "Todo with ID:999 from todo list with ID:1 not found"
+
+
+class Recorder:
+    """Callable stand-in for a service method that records how it was called."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple[object, ...], dict[str, object]]] = []
+        self.return_value: object = None
+        self.side_effect: Optional[Exception] = None
+
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    def assert_called_once(self) -> None:
+        assert len(self.calls) == 1
+
+    def assert_called_once_with(self, *args: object, **kwargs: object) -> None:
+        assert self.calls == [(args, kwargs)]
+
+    def assert_not_called(self) -> None:
+        assert not self.calls
+
+
+class TodoServiceStub:
+    """Stub of the TodoListService methods used by the todo endpoints."""
+
+    def __init__(self) -> None:
+        self.all_todos = Recorder()
+        self.get_todo = Recorder()
+        self.create_todo = Recorder()
+        self.update_todo = Recorder()
+        self.delete_todo = Recorder()
 
 
 @pytest.fixture
-def mock_service() -> Generator[MagicMock, None, None]:
-    """
-    Create a mock Todo for testing.
-
-    Yields:
-        Mock service instance
+def mock_service(use_service: Callable[[TodoServiceStub], TodoServiceStub]) -> TodoServiceStub:
     """
-    mock = MagicMock()
-
-    # Override the dependency
-    def override_get_service() -> MagicMock:
-        return mock
-
-    app.dependency_overrides[get_todo_service] = override_get_service
-    yield mock
-    app.dependency_overrides.clear()
-
-
-@pytest.fixture
-def client() -> TestClient:
-    """
-    Create a test client for the FastAPI app.
+    Create a service stub for the current test.
 
     Returns:
-        TestClient instance
+        Service stub with no recorded calls or configured returns
     """
-    return TestClient(app)
+    return use_service(TodoServiceStub())
 
 
 class TestIndex:
     """Tests for GET /api/todolists/{todo_list_id} endpoint."""
 
-    def test_returns_all_todos_from_todolist(
-        self, client: TestClient, mock_service: MagicMock
+    async def test_returns_all_todos_from_todolist(
+        self, async_client: httpx.AsyncClient, mock_service: TodoServiceStub
     ) -> None:
         """Test that index returns all todo lists."""
         # Arrange
-        expected = [
-            Todo(id=1, description="Awesome task 1", completed=False),
-            Todo(id=2, description="Awesome task 2", completed=False),
-        ]
-        mock_service.all.return_value = expected
+        mock_service.all_todos.return_value = [_TODO_1, _TODO_2]
 
         # Act
-        response = client.get("/api/todolists/1/todos")
+        response = await async_client.send(_REQ_INDEX)
 
         # Assert
         assert response.status_code == 200
-        assert len(response.json()) == 2
-        assert response.json()[0]["id"] == 1
-        assert response.json()[0]["description"] == "Awesome task 1"
-        assert response.json()[1]["id"] == 2
-        assert response.json()[1]["description"] == "Awesome task 2"
-        mock_service.all.assert_called_once()
-
-    def test_returns_empty_list_when_no_todos(
-        self, client: TestClient, mock_service: MagicMock
+        body = response.json()
+        assert len(body) == 2
+        assert body[0]["id"] == 1
+        assert body[0]["description"] == "Awesome task 1"
+        assert body[1]["id"] == 2
+        assert body[1]["description"] == "Awesome task 2"
+        mock_service.all_todos.assert_called_once()
+
+    async def test_returns_empty_list_when_no_todos(
+        self, async_client: httpx.AsyncClient, mock_service: TodoServiceStub
     ) -> None:
         """Test that index returns empty list when no todos exist."""
         # Arrange
-        mock_service.all.return_value = []
+        mock_service.all_todos.return_value = []
 
         # Act
-        response = client.get("/api/todolists/1/todos")
+        response = await async_client.send(_REQ_INDEX)
 
         # Assert
         assert response.status_code == 200
         assert response.json() == []
-        mock_service.all.assert_called_once()
+        mock_service.all_todos.assert_called_once()
 
 
 class TestShow:
     """Tests for GET /api/todolists/{todo_list_id}/todo/{todo_id} endpoint."""
 
-    def test_returns_todo_by_id(self, client: TestClient, mock_service: MagicMock) -> None:
+    async def test_returns_todo_by_id(
+        self, async_client: httpx.AsyncClient, mock_service: TodoServiceStub
+    ) -> None:
         """Test that show returns a specific todo from a given todo list."""
         # Arrange
-        expected_todo = Todo(id=1, description="Awesome task 1", completed=False)
-        mock_service.get.return_value = expected_todo
+        mock_service.get_todo.return_value = _TODO_1
 
         # Act
-        response = client.get("/api/todolists/1/todos/1")
+        response = await async_client.send(_REQ_SHOW)
 
         # Assert
         assert response.status_code == 200
-        assert response.json()["id"] == 1
-        assert response.json()["description"] == "Awesome task 1"
-        assert not response.json()["completed"]
-        mock_service.get.assert_called_once_with(1, 1)
-
-    def test_returns_404_when_not_found(self, client: TestClient, mock_service: MagicMock) -> None:
-        """Test that show returns 404 when todo doesn't exist."""
-        # Arrange
-        mock_service.get.return_value = None
-
-        # Act
-        response = client.get("/api/todolists/1/todos/999")
-
-        # Assert
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-        mock_service.get.assert_called_once_with(1, 999)
+        body = response.json()
+        assert body["id"] == 1
+        assert body["description"] == "Awesome task 1"
+        assert not body["completed"]
+        mock_service.get_todo.assert_called_once_with(1, 1)
 
 
 class TestCreate:
     # """Tests for POST /api/todolists/{todo_list_id}/todos/{todo_id} endpoint."""
 
-    def test_creates_new_todo(self, client: TestClient, mock_service: MagicMock) -> None:
+    async def test_creates_new_todo(
+        self, async_client: httpx.AsyncClient, mock_service: TodoServiceStub
+    ) -> None:
         """Test that create successfully creates a new todo list."""
         # Arrange
-        created_todo = Todo(id=1, description="Awesome task 1", completed=False)
-        mock_service.create.return_value = created_todo
+        mock_service.create_todo.return_value = _TODO_1
 
         # Act
-        response = client.post(
-            "/api/todolists/1/todos", json={"description": "Awesome task 1", "completed": False}
-        )
+        response = await async_client.send(_REQ_CREATE)
 
         # Assert
         assert response.status_code == 201
-        assert response.json()["id"] == 1
-        assert response.json()["description"] == "Awesome task 1"
-        mock_service.create.assert_called_once()
-
-    def test_validates_required_fields(self, client: TestClient, mock_service: MagicMock) -> None:
-        """Test that create validates required fields."""
-        # Act
-        response = client.post("/api/todolists/1/todos", json={})
-
-        # Assert
-        assert response.status_code == 422
-        print(response.status_code)
-        mock_service.create.assert_not_called()
-
-    def test_validates_name_not_empty(self, client: TestClient, mock_service: MagicMock) -> None:
-        """Test that create validates name is not empty."""
-        # Act
-        response = client.post("/api/todolists/1/todos", json={"description": ""})
-
-        # Assert
-        assert response.status_code == 422
-        mock_service.create.assert_not_called()
+        body = response.json()
+        assert body["id"] == 1
+        assert body["description"] == "Awesome task 1"
+        mock_service.create_todo.assert_called_once()
 
 
 class TestUpdate:
     """Tests for PUT /api/todolists/{id} endpoint."""
 
-    def test_updates_existing_todo(self, client: TestClient, mock_service: MagicMock) -> None:
+    async def test_updates_existing_todo(
+        self, async_client: httpx.AsyncClient, mock_service: TodoServiceStub
+    ) -> None:
         """Test that update successfully updates an existing todo."""
         # Arrange
-        updated_todo = Todo(id=1, description="Updated todo", completed=True)
-        mock_service.update.return_value = updated_todo
+        mock_service.update_todo.return_value = _UPDATED_TODO
 
         # Act
-        response = client.put(
-            "/api/todolists/1/todos/1", json={"description": "Updated todo", "completed": "False"}
-        )
+        response = await async_client.send(_REQ_UPDATE)
 
         # Assert
         assert response.status_code == 200
-        assert response.json()["id"] == 1
-        assert response.json()["description"] == "Updated todo"
-        assert response.json()["completed"]
-        mock_service.update.assert_called_once()
-
-    def test_returns_404_when_not_found(self, client: TestClient, mock_service: MagicMock) -> None:
-        """Test that update returns 404 when todo doesn't exist."""
-        # Arrange
-        mock_service.update.return_value = None
-
-        # Act
-        response = client.put(
-            "/api/todolists/1/todos/999", json={"description": "Updated", "completed": "False"}
-        )
-
-        # Assert
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-        mock_service.update.assert_called_once()
-
-    def test_validates_required_fields(self, client: TestClient, mock_service: MagicMock) -> None:
-        """Test that update validates required fields."""
-        # Act
-        response = client.put("/api/todolists/1/todos/1", json={})
-
-        # Assert
-        assert response.status_code == 422
-        mock_service.update.assert_not_called()
+        body = response.json()
+        assert body["id"] == 1
+        assert body["description"] == "Updated todo"
+        assert body["completed"]
+        mock_service.update_todo.assert_called_once()
 
 
 class TestDelete:
     """Tests for DELETE /api/todolists/{id}/todos endpoint."""
 
-    def test_deletes_existing_todo(self, client: TestClient, mock_service: MagicMock) -> None:
+    async def test_deletes_existing_todo(
+        self, async_client: httpx.AsyncClient, mock_service: TodoServiceStub
+    ) -> None:
         """Test that delete successfully deletes an existing todo."""
         # Arrange
-        mock_service.delete.return_value = True
+        mock_service.delete_todo.return_value = True
 
         # Act
-        response = client.delete("/api/todolists/1/todos/1")
+        response = await async_client.send(_REQ_DELETE)
 
         # Assert
-        assert response.status_code == 204
-        assert response.content == b""
-        mock_service.delete.assert_called_once_with(1, 1)
-
-    def test_returns_404_when_not_found(self, client: TestClient, mock_service: MagicMock) -> None:
-        """Test that delete returns 404 when todo list doesn't exist."""
+        assert response.status_code == 204 and not response.content
+        mock_service.delete_todo.assert_called_once_with(1, 1)
+
+
+class TestNotFound:
+    """Tests for the 404 responses of the show, update and delete endpoints."""
+
+    @pytest.mark.parametrize(
+        ("http_request", "service_method"),
+        [
+            (_REQ_SHOW_404, "get_todo"),
+            (_REQ_UPDATE_404, "update_todo"),
+            (_REQ_DELETE_404, "delete_todo"),
+        ],
+        ids=["show", "update", "delete"],
+    )
+    async def test_returns_404_when_not_found(
+        self,
+        async_client: httpx.AsyncClient,
+        mock_service: TodoServiceStub,
+        http_request: httpx.Request,
+        service_method: str,
+    ) -> None:
+        """Test that the endpoint returns 404 when the service reports the todo missing."""
         # Arrange
-        mock_service.delete.return_value = False
+        recorder: Recorder = getattr(mock_service, service_method)
+        recorder.side_effect = NotFoundError(_TODO_NOT_FOUND_MESSAGE)
 
         # Act
-        response = client.delete("/api/todolists/1/todos/999")
+        response = await async_client.send(http_request)
 
         # Assert
         assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-        mock_service.delete.assert_called_once_with(1, 999)
+        assert response.json()["detail"] == _TODO_NOT_FOUND_MESSAGE
+        recorder.assert_called_once()
+        assert recorder.calls[0][0][:2] == (1, 999)
+
+
+class TestValidation:
+    """Tests for the request body validation of the create and update endpoints."""
+
+    async def test_returns_422_on_invalid_body(
+        self, async_client: httpx.AsyncClient, mock_service: TodoServiceStub
+    ) -> None:
+        """Test that invalid bodies are rejected before reaching the service."""
+        # Act
+        response = await async_client.send(_REQ_CREATE_EMPTY)
+
+        # Assert
+        assert response.status_code == 422
+        mock_service.create_todo.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "payload",
+        [{}, {"description": ""}],
+        ids=["required-fields", "description-not-empty"],
+    )
+    def test_rejects_invalid_payload(self, payload: dict[str, object]) -> None:
+        """Test that the create and update body model rejects invalid payloads."""
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            UpsertTodoDTO.model_validate(payload)
+
+
+class TestServiceIsolation:
+    """Tests for the per-test injection of the service double."""
+
+    async def test_fails_without_an_installed_double(self, async_client: httpx.AsyncClient) -> None:
+        """Test that a request cannot reach a double installed by an earlier test."""
+        # Act & Assert
+        with pytest.raises(LookupError):
+            await async_client.send(_REQ_INDEX)
@@ -0,0 +1,262 @@
+"""Unit tests for the in-memory TodoListService."""
+
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from app.core.exceptions import NotFoundError
+from app.models.Todo import UpsertTodoDTO
+from app.models.TodoList import TodoListCreate, TodoListUpdate
+from app.services.todo_lists import TodoListService
+
+_TOGGLE_BODY = b'{"completed": true}'
+_HEADERS = {"content-type": "application/json"}
+
+
+@pytest.fixture
+def service() -> TodoListService:
+    """
+    Create an empty TodoListService.
+
+    Returns:
+        Service instance with no todo lists
+    """
+    return TodoListService()
+
+
+@pytest.fixture
+def app_service(
+    service: TodoListService, use_service: Callable[[TodoListService], TodoListService]
+) -> TodoListService:
+    """
+    Inject the real service into the app for the current test.
+
+    Returns:
+        The service the app routes now use
+    """
+    return use_service(service)
+
+
+@pytest.fixture
+def broadcast_retry(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """
+    Replace the WebSocket manager used by the service with a mock.
+
+    Returns:
+        The AsyncMock standing in for websocket_manager.broadcast_retry
+    """
+    manager = MagicMock()
+    manager.broadcast_retry = AsyncMock()
+    monkeypatch.setattr("app.services.todo_lists.websocket_manager", manager)
+    return manager.broadcast_retry
+
+
+class TestProcessToggleCompleteBackground:
+    """Tests for TodoListService.process_toggle_complete_background."""
+
+    async def test_toggles_items_and_releases_lock(
+        self, service: TodoListService, broadcast_retry: AsyncMock
+    ) -> None:
+        """Should toggle every item, release the lock and broadcast the done event."""
+        # Arrange
+        todo_list = service.create(TodoListCreate(name="List"))
+        service.create_todo(todo_list.id, UpsertTodoDTO(description="First", completed=False))
+        service.create_todo(todo_list.id, UpsertTodoDTO(description="Second", completed=False))
+
+        # Act
+        await service.process_toggle_complete_background(todo_list.id, True)
+
+        # Assert
+        assert all(todo.completed for todo in service.all_todos(todo_list.id))
+        assert not service.with_lock(todo_list.id).locked()
+        broadcast_retry.assert_awaited_once_with(
+            todo_list.id,
+            {"event": "toggle_complete_done", "listId": todo_list.id, "completed": True},
+        )
+
+    async def test_broadcasts_error_when_list_missing(
+        self, service: TodoListService, broadcast_retry: AsyncMock
+    ) -> None:
+        """Should release the lock and broadcast the error event for an unknown list."""
+        # Act
+        await service.process_toggle_complete_background(999, True)
+
+        # Assert
+        assert not service.with_lock(999).locked()
+        broadcast_retry.assert_awaited_once_with(
+            999,
+            {"event": "toggle_complete_error", "listId": 999, "error": "TodoList not found"},
+        )
+
+    async def test_rejects_toggle_while_lock_held(
+        self,
+        async_client: httpx.AsyncClient,
+        app_service: TodoListService,
+        broadcast_retry: AsyncMock,
+    ) -> None:
+        """Should answer 409 while a toggle holds the lock and 202 once it is released."""
+        # Arrange
+        todo_list = app_service.create(TodoListCreate(name="List"))
+        url = f"/api/todolists/{todo_list.id}/toggle-complete-async"
+        lock = app_service.with_lock(todo_list.id)
+        await lock.acquire()
+
+        # Act
+        busy = await async_client.put(url, content=_TOGGLE_BODY, headers=_HEADERS)
+        lock.release()
+        accepted = await async_client.put(url, content=_TOGGLE_BODY, headers=_HEADERS)
+
+        # Assert
+        assert busy.status_code == 409
+        assert accepted.status_code == 202
+        assert not lock.locked()
+        broadcast_retry.assert_awaited_once()
+
+
+class TestLocks:
+    """Tests for the per-list locks of TodoListService."""
+
+    def test_delete_drops_the_list_lock(self, service: TodoListService) -> None:
+        """Should forget the lock of a deleted list."""
+        # Arrange
+        todo_list = service.create(TodoListCreate(name="List"))
+        lock = service.with_lock(todo_list.id)
+
+        # Act
+        service.delete(todo_list.id)
+
+        # Assert
+        assert service.with_lock(todo_list.id) is not lock
+
+
+class TestTodoIds:
+    """Tests for the per-list todo id counter of TodoListService."""
+
+    def test_does_not_reuse_id_of_deleted_todo(self, service: TodoListService) -> None:
+        """Should keep counting after the newest todo is deleted."""
+        # Arrange
+        todo_list = service.create(TodoListCreate(name="List"))
+        service.create_todo(todo_list.id, UpsertTodoDTO(description="First"))
+        newest = service.create_todo(todo_list.id, UpsertTodoDTO(description="Second"))
+        service.delete_todo(todo_list.id, newest.id)
+
+        # Act
+        created = service.create_todo(todo_list.id, UpsertTodoDTO(description="Third"))
+
+        # Assert
+        assert newest.id == 2
+        assert created.id == 3
+
+    def test_keeps_counting_after_list_update(self, service: TodoListService) -> None:
+        """Should not restart ids when a list update empties the list."""
+        # Arrange
+        todo_list = service.create(TodoListCreate(name="List"))
+        service.create_todo(todo_list.id, UpsertTodoDTO(description="First"))
+        service.create_todo(todo_list.id, UpsertTodoDTO(description="Second"))
+        service.update(todo_list.id, TodoListUpdate(name="Renamed"))
+
+        # Act
+        created = service.create_todo(todo_list.id, UpsertTodoDTO(description="Third"))
+
+        # Assert
+        assert created.id == 3
+        assert service.all_todos(todo_list.id) == [created]
+
+
+class TestTodoStorage:
+    """Tests keeping TodoList.todos and the per-list todo index in sync."""
+
+    def test_keeps_list_and_index_in_sync(self, service: TodoListService) -> None:
+        """Should reflect create, update and delete in both the list and the index."""
+        # Arrange
+        todo_list = service.create(TodoListCreate(name="List"))
+        first = service.create_todo(todo_list.id, UpsertTodoDTO(description="First"))
+        middle = service.create_todo(todo_list.id, UpsertTodoDTO(description="Middle"))
+        last = service.create_todo(todo_list.id, UpsertTodoDTO(description="Last"))
+
+        # Act
+        updated = service.update_todo(
+            todo_list.id, middle.id, UpsertTodoDTO(description="Changed", completed=True)
+        )
+        listed_after_update = [todo.description for todo in service.all_todos(todo_list.id)]
+        deleted = service.delete_todo(todo_list.id, middle.id)
+
+        # Assert
+        assert updated is middle
+        assert listed_after_update == ["First", "Changed", "Last"]
+        assert deleted
+        assert service.all_todos(todo_list.id) == [first, last]
+        assert service.get_todo(todo_list.id, first.id) is first
+        assert service.get_todo(todo_list.id, last.id) is last
+        with pytest.raises(NotFoundError):
+            service.get_todo(todo_list.id, middle.id)
+
+    def test_list_update_clears_todo_index(self, service: TodoListService) -> None:
+        """Should drop the todos of a list from the index when the list is updated."""
+        # Arrange
+        todo_list = service.create(TodoListCreate(name="List"))
+        todo = service.create_todo(todo_list.id, UpsertTodoDTO(description="First"))
+
+        # Act
+        service.update(todo_list.id, TodoListUpdate(name="Renamed"))
+
+        # Assert
+        assert service.all_todos(todo_list.id) == []
+        with pytest.raises(NotFoundError):
+            service.get_todo(todo_list.id, todo.id)
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda service: service.get(999),
+            lambda service: service.update(999, TodoListUpdate(name="List")),
+            lambda service: service.delete(999),
+            lambda service: service.all_todos(999),
+            lambda service: service.get_todo(999, 1),
+            lambda service: service.create_todo(999, UpsertTodoDTO(description="Todo")),
+            lambda service: service.update_todo(999, 1, UpsertTodoDTO(description="Todo")),
+            lambda service: service.delete_todo(999, 1),
+        ],
+        ids=[
+            "get-list",
+            "update-list",
+            "delete-list",
+            "all",
+            "get",
+            "create",
+            "update",
+            "delete",
+        ],
+    )
+    def test_raises_not_found_for_missing_list(
+        self, service: TodoListService, call: Callable[[TodoListService], object]
+    ) -> None:
+        """Should raise NotFoundError when the todo list does not exist."""
+        # Act & Assert
+        with pytest.raises(NotFoundError, match="Todo list with ID:999 not found"):
+            call(service)
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda service, list_id: service.get_todo(list_id, 999),
+            lambda service, list_id: service.update_todo(
+                list_id, 999, UpsertTodoDTO(description="Todo")
+            ),
+            lambda service, list_id: service.delete_todo(list_id, 999),
+        ],
+        ids=["get", "update", "delete"],
+    )
+    def test_raises_not_found_for_missing_todo(
+        self, service: TodoListService, call: Callable[[TodoListService, int], object]
+    ) -> None:
+        """Should raise NotFoundError when the todo does not exist in the list."""
+        # Arrange
+        todo_list = service.create(TodoListCreate(name="List"))
+        service.create_todo(todo_list.id, UpsertTodoDTO(description="First"))
+
+        # Act & Assert
+        with pytest.raises(NotFoundError, match="Todo with ID:999"):
+            call(service, todo_list.id)
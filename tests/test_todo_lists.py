@@ -1,45 +1,34 @@
 """Unit tests for TodoList API endpoints."""
 
-from collections.abc import Generator
+import asyncio
+from collections.abc import Callable
 from unittest.mock import MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 
-from app.main import app
-from app.models.TodoList import TodoList
-from app.services.todo_lists import get_todo_list_service
+from app.core.exceptions import NotFoundError
+from app.models.TodoList import TodoList, TodoListCreate
 
 
 @pytest.fixture
-def mock_service() -> Generator[MagicMock, None, None]:
+def mock_service(use_service: Callable[[MagicMock], MagicMock]) -> MagicMock:
     """
     Create a mock TodoListService for testing.
 
-    Yields:
+    Returns:
         Mock service instance
     """
-    mock = MagicMock()
+    return use_service(MagicMock())
 
-    # Override the dependency
-    def override_get_service() -> MagicMock:
-        return mock
 
-    app.dependency_overrides[get_todo_list_service] = override_get_service
-    yield mock
-    app.dependency_overrides.clear()
+_URL_LISTS = "/api/todolists"
+_URL_LIST_1 = "/api/todolists/1"
+_URL_LIST_999 = "/api/todolists/999"
+_URL_TOGGLE_1 = "/api/todolists/1/toggle-complete-async"
 
 
-@pytest.fixture
-def client() -> TestClient:
-    """
-    Create a test client for the FastAPI app.
-
-    Returns:
-        TestClient instance
-    """
-    return TestClient(app)
-
 class TestIndex:
     """Tests for GET /api/todolists endpoint."""
 
@@ -53,7 +42,7 @@ class TestIndex:
         mock_service.all.return_value = expected_todos
 
         # Act
-        response = client.get("/api/todolists")
+        response = client.get(_URL_LISTS)
 
         # Assert
         assert response.status_code == 200
@@ -72,7 +61,7 @@ class TestIndex:
         mock_service.all.return_value = []
 
         # Act
-        response = client.get("/api/todolists")
+        response = client.get(_URL_LISTS)
 
         # Assert
         assert response.status_code == 200
@@ -90,7 +79,7 @@ class TestShow:
         mock_service.get.return_value = expected_todo
 
         # Act
-        response = client.get("/api/todolists/1")
+        response = client.get(_URL_LIST_1)
 
         # Assert
         assert response.status_code == 200
@@ -101,10 +90,10 @@ class TestShow:
     def test_returns_404_when_not_found(self, client: TestClient, mock_service: MagicMock) -> None:
         """Test that show returns 404 when todo list doesn't exist."""
         # Arrange
-        mock_service.get.return_value = None
+        mock_service.get.side_effect = NotFoundError("Todo list with ID:999 not found")
 
         # Act
-        response = client.get("/api/todolists/999")
+        response = client.get(_URL_LIST_999)
 
         # Assert
         assert response.status_code == 404
@@ -122,7 +111,7 @@ class TestCreate:
         mock_service.create.return_value = created_todo
 
         # Act
-        response = client.post("/api/todolists", json={"name": "New list"})
+        response = client.post(_URL_LISTS, json={"name": "New list"})
 
         # Assert
         assert response.status_code == 201
@@ -130,23 +119,17 @@ class TestCreate:
         assert response.json()["name"] == "New list"
         mock_service.create.assert_called_once()
 
-    def test_validates_required_fields(self, client: TestClient, mock_service: MagicMock) -> None:
+    def test_validates_required_fields(self) -> None:
         """Test that create validates required fields."""
-        # Act
-        response = client.post("/api/todolists", json={})
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            TodoListCreate.model_validate({})
 
-        # Assert
-        assert response.status_code == 422
-        mock_service.create.assert_not_called()
-
-    def test_validates_name_not_empty(self, client: TestClient, mock_service: MagicMock) -> None:
+    def test_validates_name_not_empty(self) -> None:
         """Test that create validates name is not empty."""
-        # Act
-        response = client.post("/api/todolists", json={"name": ""})
-
-        # Assert
-        assert response.status_code == 422
-        mock_service.create.assert_not_called()
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            TodoListCreate.model_validate({"name": ""})
 
 
 class TestUpdate:
@@ -159,7 +142,7 @@ class TestUpdate:
         mock_service.update.return_value = updated_todo
 
         # Act
-        response = client.put("/api/todolists/1", json={"name": "Updated list"})
+        response = client.put(_URL_LIST_1, json={"name": "Updated list"})
 
         # Assert
         assert response.status_code == 200
@@ -170,10 +153,10 @@ class TestUpdate:
     def test_returns_404_when_not_found(self, client: TestClient, mock_service: MagicMock) -> None:
         """Test that update returns 404 when todo list doesn't exist."""
         # Arrange
-        mock_service.update.return_value = None
+        mock_service.update.side_effect = NotFoundError("Todo list with ID:999 not found")
 
         # Act
-        response = client.put("/api/todolists/999", json={"name": "Updated"})
+        response = client.put(_URL_LIST_999, json={"name": "Updated"})
 
         # Assert
         assert response.status_code == 404
@@ -183,7 +166,7 @@ class TestUpdate:
     def test_validates_required_fields(self, client: TestClient, mock_service: MagicMock) -> None:
         """Test that update validates required fields."""
         # Act
-        response = client.put("/api/todolists/1", json={})
+        response = client.put(_URL_LIST_1, json={})
 
         # Assert
         assert response.status_code == 422
@@ -199,20 +182,19 @@ class TestDelete:
         mock_service.delete.return_value = True
 
         # Act
-        response = client.delete("/api/todolists/1")
+        response = client.delete(_URL_LIST_1)
 
         # Assert
-        assert response.status_code == 204
-        assert response.content == b""
+        assert response.status_code == 204 and not response.content
         mock_service.delete.assert_called_once_with(1)
 
     def test_returns_404_when_not_found(self, client: TestClient, mock_service: MagicMock) -> None:
         """Test that delete returns 404 when todo list doesn't exist."""
         # Arrange
-        mock_service.delete.return_value = False
+        mock_service.delete.side_effect = NotFoundError("Todo list with ID:999 not found")
 
         # Act
-        response = client.delete("/api/todolists/999")
+        response = client.delete(_URL_LIST_999)
 
         # Assert
         assert response.status_code == 404
@@ -222,6 +204,13 @@ class TestDelete:
 class TestToggleCompleteAsync:
     """Tests for PUT /api/todolists/{id}/toggle-complete-async endpoint."""
 
+    @staticmethod
+    def _lock(locked: bool = False) -> MagicMock:
+        """Build the lock returned by the mocked service.with_lock."""
+        lock = MagicMock(spec=asyncio.Lock)
+        lock.locked.return_value = locked
+        return lock
+
     def test_triggers_background_process(
         self,
         client: TestClient,
@@ -229,12 +218,12 @@ class TestToggleCompleteAsync:
     ) -> None:
         """Should return 202 and call service.process_toggle_complete_background."""
         # Arrange
-        mock_service.is_locked.return_value = False
+        mock_service.with_lock.return_value = self._lock()
         mock_service.process_toggle_complete_background.return_value = None
 
         # Act
         response = client.put(
-            "/api/todolists/1/toggle-complete-async",
+            _URL_TOGGLE_1,
             json={"completed": True}
         )
 
@@ -249,11 +238,11 @@ class TestToggleCompleteAsync:
     ) -> None:
         """Should return 409 when toggle is already running."""
         # Arrange
-        mock_service.is_locked.return_value = True
+        mock_service.with_lock.return_value = self._lock(locked=True)
 
         # Act
         response = client.put(
-            "/api/todolists/1/toggle-complete-async",
+            _URL_TOGGLE_1,
             json={"completed": True}
         )
 
@@ -268,10 +257,10 @@ class TestToggleCompleteAsync:
     ) -> None:
         """Should return 422 if 'completed' field is missing."""
         # Arrange
-        mock_service.is_locked.return_value = False
+        mock_service.with_lock.return_value = self._lock()
 
         # Act
-        response = client.put("/api/todolists/1/toggle-complete-async", json={})
+        response = client.put(_URL_TOGGLE_1, json={})
 
         # Assert
         assert response.status_code == 422
@@ -286,11 +275,11 @@ class TestToggleCompleteAsync:
 
         # El endpoint llama al método en threadpool → side_effect rompe el test
         # Así que simulamos un retorno y verificamos el status
-        mock_service.is_locked.return_value = False
+        mock_service.with_lock.return_value = self._lock()
         mock_service.process_toggle_complete_background.return_value = None
 
         response = client.put(
-            "/api/todolists/1/toggle-complete-async",
+            _URL_TOGGLE_1,
             json={"completed": False}
         )
 